@@ -6,31 +6,155 @@ A comprehensive monitoring system for Xray configurations
 
 import os
 import json
+import argparse
 import base64
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import platform
 import time
 import threading
+import multiprocessing
 import logging
+import logging.handlers
+import atexit
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import queue
 import signal
+import socket
+import tempfile
 import sys
+import copy
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
-# Configure logging
+from convert import convert
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging; records are handed to a background listener so test threads never block on I/O
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('monitor.log', delay=True),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('monitor.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Platform details never change at runtime, so resolve them once
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == "windows"
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0) if _IS_WINDOWS else 0
+_XRAY_PATHS = {
+    "windows": "./core/win/xray.exe",
+    "linux": "./core/linux/xray",
+    "darwin": "./core/macos/xray",
+}
+
+# Placeholders for the per-test ports in pre-rendered config templates
+PORT_SOCKS_SENTINEL = "__PORT_SOCKS__"
+PORT_API_SENTINEL = "__PORT_API__"
+
+# Subscriptions smaller than this are converted inline instead of in a process pool
+PARALLEL_CONVERT_MIN = 32
+
+@lru_cache(maxsize=2048)
+def _unquote(name: str) -> str:
+    """Decode URL-encoded config names (like %F0%9F%87%AB), cached across cycles"""
+    return urllib.parse.unquote(name)
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+@lru_cache(maxsize=1024)
+def _resolve(host: str, port: int) -> Tuple:
+    """Resolve a server address once and reuse it for later TCP pings"""
+    family, socktype, proto, _, sockaddr = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)[0]
+    return family, socktype, proto, sockaddr
+
+def _wait_port_ready(port: int, timeout: float = 3.0) -> bool:
+    """Wait until a local Xray port accepts connections"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.05):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+def _dumps_compact(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON for files and pipes only Xray reads"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Process umask, read once at import while nothing else can change it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write a sibling temp file with raw os calls and swap it in, so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix='.tmp')
+    try:
+        try:
+            # mkstemp creates the file 0600; keep the target's mode, or what open() would give it
+            if hasattr(os, "fchmod"):
+                try:
+                    mode = os.stat(path).st_mode & 0o7777
+                except FileNotFoundError:
+                    mode = 0o666 & ~_UMASK
+                os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _render_template(config: Dict) -> str:
+    """Render a config as JSON with placeholder ports for the test inbounds"""
+    config = copy.deepcopy(config)
+    for inbound in config.get('inbounds', []):
+        if inbound.get('tag') == 'socks':
+            inbound['port'] = PORT_SOCKS_SENTINEL
+        elif inbound.get('tag') == 'api':
+            inbound['port'] = PORT_API_SENTINEL
+    return json.dumps(config, separators=(',', ':'))
+
+def _convert_one(item: Tuple[int, str]) -> Tuple[int, Optional[str], Optional[str], Optional[str]]:
+    """Convert a single subscription entry (runs in a worker process)"""
+    idx, config_line = item
+    try:
+        config_json, config_name = convert(config_line)
+        return idx, config_json, config_name, None
+    except Exception as e:
+        return idx, None, None, str(e)
+
 class ConfigFetcher:
     """Fetches and processes subscription configurations"""
     
@@ -38,6 +162,27 @@ class ConfigFetcher:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
         self.subscription_url = None
+        self._session = requests.Session()
+        self._meta_file = self.config_dir / "sub_meta.json"
+        self._sub_meta = self._load_sub_meta()
+        
+    def _load_sub_meta(self) -> Dict:
+        """Load cache validators from the last successful subscription fetch"""
+        try:
+            with open(self._meta_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_sub_meta(self, response: requests.Response, sha: str):
+        """Persist the subscription hash and cache validators"""
+        self._sub_meta = {
+            "url": self.subscription_url,
+            "sha256": sha,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+        _atomic_write_bytes(self._meta_file, _dumps(self._sub_meta))
         
     def set_subscription_url(self, url: str):
         """Set the subscription URL"""
@@ -63,13 +208,28 @@ class ConfigFetcher:
                 return False
         
         try:
-            logger.info(f"Fetching configs from: {self.subscription_url}")
+            logger.info("Fetching configs from: %s", self.subscription_url)
             
-            # Fetch subscription data
+            # Fetch subscription data, revalidating against the last fetch when possible
             headers = {"User-Agent": "XrayMonitor/1.0"}
-            response = requests.get(self.subscription_url, headers=headers, timeout=30)
+            meta = self._sub_meta if self._sub_meta.get("url") == self.subscription_url else {}
+            have_configs = (self.config_dir / "config_list.json").exists()
+            if have_configs and meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if have_configs and meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            
+            response = self._session.get(self.subscription_url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                logger.info("Subscription not modified, keeping existing configs")
+                return True
             response.raise_for_status()
             
+            sha = hashlib.sha256(response.content).hexdigest()
+            if have_configs and meta.get("sha256") == sha:
+                logger.info("Subscription content unchanged, keeping existing configs")
+                return True
+            
             # Decode base64 content
             content = response.text.strip()
             if not content:
@@ -79,7 +239,7 @@ class ConfigFetcher:
             try:
                 decoded = base64.b64decode(content).decode('utf-8')
             except Exception as e:
-                logger.warning(f"Base64 decode failed, trying direct parse: {e}")
+                logger.warning("Base64 decode failed, trying direct parse: %s", e)
                 decoded = content
             
             # Parse configurations
@@ -89,55 +249,196 @@ class ConfigFetcher:
                 logger.error("No configurations found in subscription")
                 return False
             
-            logger.info(f"Found {len(configs)} configurations")
+            logger.info("Found %d configurations", len(configs))
             
             # Convert and save each config
             saved_count = 0
             config_list = {}
             
-            for idx, config_line in enumerate(configs):
-                try:
-                    # Import convert module
-                    from convert import convert
-                    
-                    # Convert to Xray JSON format
-                    config_json, config_name = convert(config_line)
+            # Convert entries in parallel; file writes stay in this process.
+            # Small subscriptions convert faster inline than forking workers would take
+            workers = min(os.cpu_count() or 1, len(configs))
+            executor = ProcessPoolExecutor(max_workers=workers) if len(configs) >= PARALLEL_CONVERT_MIN and workers > 1 else None
+            try:
+                if executor is not None:
+                    chunksize = max(1, len(configs) // (4 * workers))
+                    converted = executor.map(_convert_one, enumerate(configs), chunksize=chunksize)
+                else:
+                    converted = map(_convert_one, enumerate(configs))
+                
+                for idx, config_json, config_name, error in converted:
+                    if error:
+                        logger.error("Error processing config %d: %s", idx, error)
+                        continue
                     
-                    if config_json and config_name != "False":
-                        # Fix URL-encoded emoji names
-                        try:
-                            import urllib.parse
-                            # Decode URL-encoded characters (like %F0%9F%87%AB)
-                            config_name = urllib.parse.unquote(config_name)
-                        except:
-                            pass
-                        
-                        # Save config file
-                        config_file = self.config_dir / f"config_{idx}.json"
-                        with open(config_file, "w", encoding="utf-8") as f:
-                            f.write(config_json)
+                    try:
+                        if config_json and config_name != "False":
+                            # Fix URL-encoded emoji names
+                            config_name = _unquote(config_name)
+                            
+                            # Save config file
+                            config = json.loads(config_json)
+                            config_file = self.config_dir / f"config_{idx}.json"
+                            with open(config_file, "wb") as f:
+                                f.write(_dumps_compact(config))
+                            
+                            # Pre-render the test template so probes never re-serialize the config
+                            with open(config_file.with_suffix(".tmpl.json"), "w", encoding="utf-8") as f:
+                                f.write(_render_template(config))
+                            
+                            config_list[f"config_{idx}"] = config_name
+                            saved_count += 1
+                            logger.info("Saved config %d: %s", idx, config_name)
                         
-                        config_list[f"config_{idx}"] = config_name
-                        saved_count += 1
-                        logger.info(f"Saved config {idx}: {config_name}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing config {idx}: {e}")
-                    continue
+                    except Exception as e:
+                        logger.error("Error processing config %d: %s", idx, e)
+                        continue
+            finally:
+                if executor is not None:
+                    executor.shutdown()
             
             # Save config list
-            with open(self.config_dir / "config_list.json", "w", encoding="utf-8") as f:
-                json.dump(config_list, f, ensure_ascii=False, indent=2)
+            _atomic_write_bytes(self.config_dir / "config_list.json", _dumps(config_list))
             
-            logger.info(f"Successfully saved {saved_count} configurations")
+            logger.info("Successfully saved %d configurations", saved_count)
+            if saved_count > 0:
+                self._save_sub_meta(response, sha)
             return saved_count > 0
             
         except requests.RequestException as e:
-            logger.error(f"Network error fetching subscription: {e}")
+            logger.error("Network error fetching subscription: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
+            return False
+
+class XrayWorker:
+    """A long-lived Xray process whose proxy outbound is swapped through its API"""
+    
+    def __init__(self, xray_path: str, socks_port: int, api_port: int):
+        self.xray_path = xray_path
+        self.socks_port = socks_port
+        self.api_port = api_port
+        self.process = None
+    
+    def start(self) -> bool:
+        """Start Xray with a placeholder outbound and wait until it listens"""
+        config = {
+            "log": {"loglevel": "warning"},
+            "api": {"tag": "api", "services": ["HandlerService"]},
+            "inbounds": [
+                {
+                    "tag": "socks",
+                    "port": self.socks_port,
+                    "listen": "127.0.0.1",
+                    "protocol": "socks",
+                    "settings": {"auth": "noauth", "udp": True}
+                },
+                {
+                    "tag": "api",
+                    "port": self.api_port,
+                    "listen": "127.0.0.1",
+                    "protocol": "dokodemo-door",
+                    "settings": {"address": "127.0.0.1"}
+                }
+            ],
+            "outbounds": [{"tag": "proxy", "protocol": "blackhole", "settings": {}}],
+            "routing": {
+                "rules": [
+                    {"type": "field", "inboundTag": ["api"], "outboundTag": "api"},
+                    {"type": "field", "inboundTag": ["socks"], "outboundTag": "proxy"}
+                ]
+            }
+        }
+        
+        self.process = subprocess.Popen(
+            [self.xray_path, 'run', '-format', 'json', '-config', 'stdin:'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=_CREATION_FLAGS
+        )
+        self.process.stdin.write(_dumps_compact(config))
+        self.process.stdin.close()
+        
+        return _wait_port_ready(self.socks_port) and _wait_port_ready(self.api_port)
+    
+    def is_alive(self) -> bool:
+        """Check whether the Xray process is still running"""
+        return self.process is not None and self.process.poll() is None
+    
+    def _api(self, command: str, *args: str, data: Optional[bytes] = None) -> bool:
+        """Run an 'xray api' command against this worker"""
+        try:
+            result = subprocess.run(
+                [self.xray_path, 'api', command, '-s', f'127.0.0.1:{self.api_port}', *args],
+                input=data,
+                capture_output=True,
+                timeout=5,
+                creationflags=_CREATION_FLAGS
+            )
+            return result.returncode == 0
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+    
+    def swap_outbound(self, config: Dict) -> bool:
+        """Replace the worker's proxy outbound with the one from config"""
+        outbound = next((o for o in config.get('outbounds', []) if o.get('tag') == 'proxy'), None)
+        if outbound is None:
             return False
+        
+        self._api('rmo', 'proxy')
+        return self._api('ado', 'stdin:', data=_dumps_compact({"outbounds": [outbound]}))
+    
+    def stop(self):
+        """Stop the Xray process"""
+        if self.process is None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+class XrayPool:
+    """Pool of pre-started Xray workers shared by the test threads"""
+    
+    def __init__(self, xray_path: str, size: int, base_port: int = 30000):
+        self.workers = [
+            XrayWorker(xray_path, base_port + 2 * i, base_port + 2 * i + 1)
+            for i in range(size)
+        ]
+        self.idle = queue.Queue()
+        self.stopped = False
+    
+    def start(self) -> bool:
+        """Start all workers, returning False if any of them fails"""
+        for worker in self.workers:
+            if not worker.start():
+                return False
+            self.idle.put(worker)
+        return True
+    
+    def acquire(self) -> XrayWorker:
+        """Take an idle worker, restarting it if its process died"""
+        worker = self.idle.get()
+        # Once stopped, a dead worker stays dead; restarting it would outlive the pool
+        if not worker.is_alive() and not self.stopped:
+            worker.stop()
+            worker.start()
+        return worker
+    
+    def release(self, worker: XrayWorker):
+        """Return a worker to the pool"""
+        self.idle.put(worker)
+    
+    def stop(self):
+        """Stop all workers"""
+        self.stopped = True
+        for worker in self.workers:
+            worker.stop()
 
 class PingTester:
     """Tests ping/delay for each configuration"""
@@ -149,117 +450,224 @@ class PingTester:
         self.test_interval = 300  # 5 minutes default
         self.running = False
         self.thread = None
-        self.results = {}
+        self._stop_event = threading.Event()
+        self.shared_results = None  # Live results shared with the web process
+        self.shared_version = None  # Bumped after each change to shared_results, so readers can skip copies
         self.test_queue = queue.Queue()
+        self.max_workers = 32  # Parallel Xray instances per test cycle
+        self._results_lock = threading.Lock()
+        self._dirty_since_save = 0
+        self._last_save = 0.0
+        self._port_lock = threading.Lock()
+        self._next_port = 20000
+        self._thread_local = threading.local()
+        self._config_cache = {}
+        self._template_cache = {}
+        self._mtimes = {}  # Config file mtimes, stat'ed once per cycle
+        self.use_pool = True  # Reuse long-lived Xray workers instead of one process per test
+        self.pool_size = 16
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self.fast_ping = False  # Time a direct TCP connect instead of a proxied probe
+        self.full_probe_every = 6  # In fast mode, still run the proxied probe every N cycles
+        # Last results and consecutive offline results per config, kept across restarts
+        self.results, self._fail_count = self._load_saved_state()
+        self._cycle = 0
+        atexit.register(self._shutdown_pool)  # Don't leave pool workers running after exit
         
+    def _load_saved_state(self) -> Tuple[Dict, Dict[str, int]]:
+        """Load the last saved results and offline streaks, so configs in backoff keep their result"""
+        try:
+            with open(self.results_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            return saved.get("results", {}), saved.get("fail_counts", {})
+        except (OSError, ValueError, AttributeError):
+            return {}, {}
+    
     def _find_xray_binary(self) -> str:
         """Find Xray binary path"""
-        system = platform.system().lower()
-        if system == "windows":
-            xray_path = "./core/win/xray.exe"
-        elif system == "linux":
-            xray_path = "./core/linux/xray"
-        elif system == "darwin":
-            xray_path = "./core/macos/xray"
-        else:
-            xray_path = "xray"
+        xray_path = _XRAY_PATHS.get(_SYSTEM, "xray")
         
         if not Path(xray_path).exists():
-            logger.warning(f"Xray binary not found at {xray_path}, using system xray")
+            logger.warning("Xray binary not found at %s, using system xray", xray_path)
             return "xray"
         
         return xray_path
     
+    def _reserve_test_ports(self) -> int:
+        """Reserve a (socks, api) port pair so parallel tests never collide"""
+        with self._port_lock:
+            port = self._next_port
+            self._next_port = port + 2 if port + 2 < 30000 else 20000
+        return port
+    
+    def _get_session(self) -> requests.Session:
+        """Get the HTTP session of the current worker thread"""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._thread_local.session = session
+        return session
+    
+    def _load_config(self, config_file: Path) -> Dict:
+        """Load a parsed config, cached until the file changes on disk"""
+        key = str(config_file)
+        mtime = self._mtimes.get(key) or config_file.stat().st_mtime
+        cached = self._config_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                cached = (mtime, json.load(f))
+            self._config_cache[key] = cached
+        return cached[1]
+    
+    def _load_template(self, config_file: Path) -> str:
+        """Load the port-templated JSON for a config, cached until the config changes"""
+        key = str(config_file)
+        mtime = self._mtimes.get(key) or config_file.stat().st_mtime
+        cached = self._template_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            template_file = config_file.with_suffix(".tmpl.json")
+            if template_file.exists():
+                template = template_file.read_text(encoding='utf-8')
+            else:
+                # Configs fetched before templates existed
+                template = _render_template(self._load_config(config_file))
+            cached = (mtime, template)
+            self._template_cache[key] = cached
+        return cached[1]
+    
+    def tcp_ping(self, config_file: Path, config_name: str) -> float:
+        """Time a plain TCP connect to the config's server and return delay in ms"""
+        try:
+            outbound = self._load_config(config_file)['outbounds'][0]
+            settings = outbound.get('settings', {})
+            servers = settings.get('vnext') or settings.get('servers') or []
+            if not servers:
+                logger.warning("Config %s: No server address found", config_name)
+                return 9999
+            
+            family, socktype, proto, sockaddr = _resolve(servers[0]['address'], int(servers[0]['port']))
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(5)
+                start_time = time.monotonic()
+                sock.connect(sockaddr)
+                delay = (time.monotonic() - start_time) * 1000
+            
+            logger.info("Config %s: %.2fms (tcp)", config_name, delay)
+            return delay
+            
+        except Exception as e:
+            logger.warning("Config %s: TCP connect failed - %s", config_name, e)
+            return 9999
+    
+    def _get_proxies(self, port: int) -> Dict[str, str]:
+        """Get the SOCKS proxy settings for a port, built once per worker thread"""
+        cache = getattr(self._thread_local, 'proxies', None)
+        if cache is None:
+            cache = self._thread_local.proxies = {}
+        proxies = cache.get(port)
+        if proxies is None:
+            proxies = cache[port] = {
+                'http': f'socks5h://127.0.0.1:{port}',
+                'https': f'socks5h://127.0.0.1:{port}'
+            }
+        return proxies
+    
+    def _probe(self, port: int, config_name: str) -> float:
+        """Probe through the local SOCKS port and return delay in ms"""
+        # Test connection through proxy
+        start_time = time.time()
+        try:
+            proxies = self._get_proxies(port)
+            
+            # Pool workers reuse their port, so never keep a tunnel from a previous outbound
+            response = self._get_session().get(
+                'http://gstatic.com/generate_204',
+                proxies=proxies,
+                headers={'Connection': 'close'},
+                timeout=10
+            )
+        
+            if response.status_code in [204, 200]:
+                delay = (time.time() - start_time) * 1000  # Convert to ms
+                logger.info("Config %s: %.2fms", config_name, delay)
+            else:
+                delay = 9999  # High value for failed connections
+                logger.warning("Config %s: Failed (status %s)", config_name, response.status_code)
+            
+        except Exception as e:
+            delay = 9999
+            logger.warning("Config %s: Connection failed - %s", config_name, e)
+        
+        return delay
+    
+    def _get_pool(self) -> Optional[XrayPool]:
+        """Start the worker pool on first use, or None if it is unavailable"""
+        with self._pool_lock:
+            if self._stop_event.is_set():
+                return None  # Stopping: a test still in flight must not start a new pool
+            if self._pool is None and self.use_pool:
+                pool = XrayPool(self.xray_path, self.pool_size)
+                if pool.start():
+                    self._pool = pool
+                else:
+                    logger.warning("Xray worker pool unavailable, spawning Xray per test")
+                    pool.stop()
+                    self.use_pool = False
+            return self._pool
+    
+    def _shutdown_pool(self):
+        """Stop the worker pool, if one is running"""
+        with self._pool_lock:
+            if self._pool:
+                self._pool.stop()
+                self._pool = None
+    
     def test_single_config(self, config_file: Path, config_name: str) -> float:
         """Test a single configuration and return delay in ms"""
-        import random
-        import tempfile
-        
         try:
+            # Prefer swapping the outbound into an already running Xray worker
+            pool = self._get_pool()
+            if pool is not None:
+                worker = pool.acquire()
+                try:
+                    if worker.swap_outbound(self._load_config(config_file)):
+                        return self._probe(worker.socks_port, config_name)
+                finally:
+                    pool.release(worker)
+                logger.warning("Config %s: Outbound swap failed, spawning Xray", config_name)
             
-            # Read and modify config for testing
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-            
-            # Use random port to avoid conflicts
-            test_port = random.randint(20000, 30000)
+            if self._stop_event.is_set():
+                return 9999  # Stopping; the result is discarded anyway
             
-            # Update ports in config
-            for inbound in config.get('inbounds', []):
-                if inbound.get('tag') == 'socks':
-                    inbound['port'] = test_port
-                elif inbound.get('tag') == 'api':
-                    inbound['port'] = test_port + 1
+            # Use a reserved port to avoid conflicts with parallel tests
+            test_port = self._reserve_test_ports()
             
-            # Write temporary config
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-                json.dump(config, tmp, indent=2)
-                tmp_config_path = tmp.name
+            # Fill the test ports into the pre-rendered config
+            config_data = self._load_template(config_file)
+            config_data = config_data.replace(f'"{PORT_SOCKS_SENTINEL}"', str(test_port))
+            config_data = config_data.replace(f'"{PORT_API_SENTINEL}"', str(test_port + 1))
             
-            # Start Xray process
-            creation_flags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
+            # Start Xray process, feeding the config through stdin instead of a temp file
             process = subprocess.Popen(
-                [self.xray_path, '-config', tmp_config_path],
+                [self.xray_path, 'run', '-format', 'json', '-config', 'stdin:'],
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                creationflags=creation_flags
+                creationflags=_CREATION_FLAGS
             )
+            process.stdin.write(config_data.encode('utf-8'))
+            process.stdin.close()
             
-            # Wait for Xray to start
-            time.sleep(3)  # Increased wait time
-            
-            # Test connection through proxy
-            start_time = time.time()
-            try:
-                # Try both socks5 and socks5h
-                proxies = {
-                    'http': f'socks5h://127.0.0.1:{test_port}',
-                    'https': f'socks5h://127.0.0.1:{test_port}'
-                }
-                
-                response = requests.get(
-                    'http://gstatic.com/generate_204',
-                    proxies=proxies,
-                    timeout=10
-                )
-                
-                if response.status_code in [204, 200]:
-                    delay = (time.time() - start_time) * 1000  # Convert to ms
-                    logger.info(f"Config {config_name}: {delay:.2f}ms")
-                else:
-                    delay = 9999  # High value for failed connections
-                    logger.warning(f"Config {config_name}: Failed (status {response.status_code})")
-                    
-            except Exception as e:
-                    delay = 9999
-                    logger.warning(f"Config {config_name}: Connection failed - {e}")
-                # Try alternative test method
-                # try:
-                #     import socket
-                #     import struct
-                    
-                #     # Simple SOCKS5 handshake test
-                #     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                #     sock.settimeout(5)
-                #     sock.connect(('127.0.0.1', test_port))
-                    
-                #     # Send SOCKS5 greeting
-                #     sock.send(b'\x05\x01\x00')
-                #     response = sock.recv(2)
-                    
-                #     if response == b'\x05\x00':
-                #         # SOCKS5 server is responding
-                #         delay = (time.time() - start_time) * 1000
-                #         logger.info(f"Config {config_name}: {delay:.2f}ms (socket test)")
-                #     else:
-                #         delay = 9999
-                #         logger.warning(f"Config {config_name}: SOCKS handshake failed")
-                    
-                #     sock.close()
-                    
-                # except Exception as sock_error:
-                #     delay = 9999
-                #     logger.warning(f"Config {config_name}: Connection failed - {sock_error}")
+            # Wait for Xray to start listening instead of a fixed sleep
+            if not _wait_port_ready(test_port):
+                delay = 9999
+                logger.warning("Config %s: Xray did not start in time", config_name)
+            else:
+                delay = self._probe(test_port, config_name)
             
             # Cleanup
             process.terminate()
@@ -269,15 +677,10 @@ class PingTester:
                 process.kill()
                 process.wait()
             
-            try:
-                os.unlink(tmp_config_path)
-            except:
-                pass
-            
             return delay
             
         except Exception as e:
-            logger.error(f"Error testing config {config_name}: {e}")
+            logger.error("Error testing config %s: %s", config_name, e)
             return 9999
     
     def run_tests(self):
@@ -296,79 +699,151 @@ class PingTester:
                 logger.warning("No configurations to test")
                 return
             
-            logger.info(f"Starting ping tests for {len(config_list)} configurations")
-            
-            # Test each configuration
+            logger.info("Starting ping tests for %d configurations", len(config_list))
+            
+            # Forget results and streaks of configs that left the subscription, so a
+            # name that comes back starts fresh and snapshots don't grow without bound
+            names = set(config_list.values())
+            with self._results_lock:
+                stale = [name for name in self._fail_count if name not in names]
+                for name in stale:
+                    del self._fail_count[name]
+                gone = [name for name in self.results if name not in names]
+                for name in gone:
+                    del self.results[name]
+                    if self.shared_results is not None:
+                        self.shared_results.pop(name, None)
+                if gone and self.shared_version is not None:
+                    self.shared_version.value += 1
+                if stale or gone:
+                    self._dirty_since_save += 1
+            
+            # Collect the configurations to test
             test_results = {}
             timestamp = datetime.now().isoformat()
+            pending = []
+            mtimes = {}
+            self._cycle += 1
             
             for config_id, config_name in config_list.items():
                 config_file = self.config_dir / f"{config_id}.json"
                 
-                if not config_file.exists():
-                    logger.warning(f"Config file not found: {config_file}")
+                # One stat per config per cycle doubles as the existence check
+                try:
+                    mtimes[str(config_file)] = config_file.stat().st_mtime
+                except OSError:
+                    logger.warning("Config file not found: %s", config_file)
                     continue
                 
-                # Fix URL-encoded names for logging
-                try:
-                    import urllib.parse
-                    display_name = urllib.parse.unquote(config_name)
-                except:
-                    display_name = config_name
+                # Back off on configs that keep failing: retest every 2^n cycles (max 12).
+                # A config with no result yet is always tested, so it never drops off the list
+                fail_count = self._fail_count.get(config_name, 0)
+                if fail_count and config_name in self.results and self._cycle % min(2 ** fail_count, 12) != 0:
+                    continue
                 
-                delay = self.test_single_config(config_file, display_name)
+                # Fix URL-encoded names for logging
+                display_name = _unquote(config_name)
                 
-                test_results[config_name] = {
-                    "delay": delay,
-                    "timestamp": timestamp,
-                    "status": "online" if delay < 9999 else "offline"
+                pending.append((config_name, config_file, display_name))
+            
+            if not pending:
+                logger.info("No configurations due for testing this cycle")
+                return
+            self._mtimes = mtimes
+            
+            # Fast mode skips Xray, but still runs the full proxied probe periodically
+            if self.fast_ping and self._cycle % self.full_probe_every != 0:
+                test_func = self.tcp_ping
+            else:
+                test_func = self.test_single_config
+            
+            # Test configurations in parallel, each with its own Xray process
+            workers = min(self.max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(test_func, config_file, display_name): config_name
+                    for config_name, config_file, display_name in pending
                 }
                 
-                # Update global results
-                self.results[config_name] = test_results[config_name]
-                
-                # Save intermediate results
-                self.save_results()
-                
-                # Small delay between tests
-                time.sleep(1)
+                for future in as_completed(futures):
+                    # Tests cut short by stop() would read as offline and grow fail streaks
+                    if self._stop_event.is_set():
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        break
+                    config_name = futures[future]
+                    try:
+                        delay = future.result()
+                    except Exception as e:
+                        logger.error("Error testing config %s: %s", config_name, e)
+                        delay = 9999
+                    
+                    test_results[config_name] = {
+                        "delay": delay,
+                        "timestamp": timestamp,
+                        "status": "online" if delay < 9999 else "offline"
+                    }
+                    
+                    # Update global results and save intermediate results
+                    with self._results_lock:
+                        self.results[config_name] = test_results[config_name]
+                        if self.shared_results is not None:
+                            self.shared_results[config_name] = test_results[config_name]
+                            self.shared_version.value += 1
+                        self._fail_count[config_name] = 0 if delay < 9999 else self._fail_count.get(config_name, 0) + 1
+                        self._dirty_since_save += 1
+                        self.save_results()
+            
+            # Flush whatever the batched saves have not written yet
+            with self._results_lock:
+                self.save_results(force=True)
             
             logger.info("Ping tests completed")
             
         except Exception as e:
-            logger.error(f"Error during ping tests: {e}")
+            logger.error("Error during ping tests: %s", e)
     
-    def save_results(self):
-        """Save test results to file"""
+    def save_results(self, force: bool = False):
+        """Save test results to file, batching intermediate writes"""
+        if not self._dirty_since_save:
+            return
+        if not force and self._dirty_since_save < 5 and time.monotonic() - self._last_save < 2.0:
+            return
+        
         try:
             # Add metadata
             output = {
                 "last_update": datetime.now().isoformat(),
                 "total_configs": len(self.results),
-                "results": self.results
+                "results": self.results,
+                "fail_counts": self._fail_count
             }
             
-            with open(self.results_file, 'w', encoding='utf-8') as f:
-                json.dump(output, f, ensure_ascii=False, indent=2)
-                
-            logger.info(f"Results saved to {self.results_file}")
+            _atomic_write_bytes(self.results_file, _dumps(output))
+            
+            self._dirty_since_save = 0
+            self._last_save = time.monotonic()
+            logger.info("Results saved to %s", self.results_file)
             
         except Exception as e:
-            logger.error(f"Error saving results: {e}")
+            logger.error("Error saving results: %s", e)
     
     def start(self, interval: int = 300):
         """Start periodic testing"""
         self.test_interval = interval
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
-        logger.info(f"Started ping testing with {interval}s interval")
+        logger.info("Started ping testing with %ds interval", interval)
     
     def stop(self):
         """Stop testing"""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=10)
+        self._shutdown_pool()
         logger.info("Stopped ping testing")
     
     def _run_loop(self):
@@ -377,23 +852,24 @@ class PingTester:
             try:
                 self.run_tests()
                 
-                # Wait for next interval
-                for _ in range(self.test_interval):
-                    if not self.running:
-                        break
-                    time.sleep(1)
+                # Wait for next interval, waking immediately on stop()
+                if self._stop_event.wait(self.test_interval):
+                    break
                     
             except Exception as e:
-                logger.error(f"Error in test loop: {e}")
-                time.sleep(10)
+                logger.error("Error in test loop: %s", e)
+                if self._stop_event.wait(10):
+                    break
 
 class MonitorController:
     """Main controller for the monitoring system"""
     
-    def __init__(self):
+    def __init__(self, fast_ping: bool = False):
         self.fetcher = ConfigFetcher()
         self.tester = PingTester()
+        self.tester.fast_ping = fast_ping
         self.web_server = None
+        self._manager = None
         
     def setup(self):
         """Interactive setup for subscription URL"""
@@ -466,18 +942,28 @@ class MonitorController:
             self.stop()
             print("Goodbye!")
         except Exception as e:
-            logger.error(f"Fatal error: {e}")
+            logger.error("Fatal error: %s", e)
             self.stop()
     
     def start_web_interface(self):
-        """Start the web interface using 'flet run' command in a separate process"""
-        import subprocess
-        import sys
-
+        """Start the web interface in a separate process, sharing live results with it"""
+        from web_interface import run_web_server
+        
+        # Share results through a manager dict so the dashboard needs no disk round trip
+        self._manager = multiprocessing.Manager()
+        with self.tester._results_lock:
+            shared_results = self._manager.dict(self.tester.results)
+            shared_version = self._manager.Value('i', 0)
+            self.tester.shared_results = shared_results
+            self.tester.shared_version = shared_version
+        
         # Start the process
-        self.web_server = subprocess.Popen(
-            ["flet", "run", "-w", "-p", "7070", "web_interface.py"]
+        self.web_server = multiprocessing.Process(
+            target=run_web_server,
+            args=("127.0.0.1", 7070, shared_results, shared_version),
+            daemon=True
         )
+        self.web_server.start()
         
         print(f"Web interface available at: http://127.0.0.1:7070")
         print(f"Flet web server started with PID: {self.web_server.pid}")
@@ -487,10 +973,20 @@ class MonitorController:
         self.tester.stop()
         if self.web_server:
             self.web_server.terminate()
+        if self._manager:
+            self._manager.shutdown()
 
 def main():
     """Main entry point"""
-    controller = MonitorController()
+    parser = argparse.ArgumentParser(description="Xray Config Monitor")
+    parser.add_argument("--fast-ping", action="store_true",
+                        help="time a direct TCP connect to each server instead of probing through Xray")
+    args = parser.parse_args()
+    
+    # Treat SIGTERM like Ctrl+C, so a normal kill still stops Xray workers and the web process
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    
+    controller = MonitorController(fast_ping=args.fast_ping)
     controller.run()
 
 if __name__ == "__main__":
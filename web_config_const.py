@@ -17,6 +17,15 @@ WEB_SERVER = {
 # Auto refresh interval (seconds)
 AUTO_REFRESH_INTERVAL = 10
 
+# Longest wait between refreshes while loading keeps failing (seconds)
+MAX_REFRESH_BACKOFF = 60
+
+# Minimum time between UI renders (seconds), caps updates at ~20 per second
+RENDER_THROTTLE_INTERVAL = 0.05
+
+# Trailing delay before applying search text (seconds)
+SEARCH_DEBOUNCE_INTERVAL = 0.15
+
 # ====================
 # DELAY CATEGORIES
 # ====================
@@ -67,13 +76,20 @@ DELAY_CATEGORIES = {
 # Mobile breakpoint (pixels)
 MOBILE_BREAKPOINT = 768
 
+# Width past the breakpoint needed to switch an existing layout (pixels)
+MOBILE_BREAKPOINT_HYSTERESIS = 32
+
+# Wait for resize events to settle before switching layouts (seconds)
+RESIZE_DEBOUNCE_INTERVAL = 0.2
+
 # Desktop grid configuration
 DESKTOP_GRID = {
     "columns": 4,           # Number of columns in grid
     "max_card_width": 350,   # Maximum card width in pixels
     "card_aspect_ratio": 1.2,
     "spacing": 20,
-    "padding": 30
+    "padding": 30,
+    "cache_extent": 50,      # Pixels of off-screen cards kept built around the viewport
 }
 
 # Mobile configuration
@@ -81,11 +97,28 @@ MOBILE_CONFIG = {
     "header_padding": 15,
     "content_padding": 10,
     "card_spacing": 10,
+    "card_height": 48,      # Fixed config card height, keeps the list virtualized
     "stat_card_width": 80,
     "search_height": 45,
     "dropdown_width": 100
 }
 
+# "No data" / error message sizes per layout
+MESSAGE_SIZES = {
+    "desktop": {
+        "message_icon": 64,
+        "message_title": 24,
+        "message_body": 16,
+        "message_padding": 50,
+    },
+    "mobile": {
+        "message_icon": 48,
+        "message_title": 20,
+        "message_body": 14,
+        "message_padding": 30,
+    },
+}
+
 # ====================
 # THEME CONFIGURATION
 # ====================
@@ -219,5 +252,6 @@ ADVANCED = {
     "offline_delay_threshold": 9999,     # Delay value to consider as offline
     "progress_bar_max_delay": 1000,      # Maximum delay for progress bar calculation
     "enable_hover_effects": True,        # Enable hover effects on desktop
+    "hover_effects_max_cards": 50,       # Skip hover effects on grids larger than this
     "show_tooltips": True,               # Show tooltips on desktop
 }
\ No newline at end of file
@@ -4,29 +4,289 @@ Mobile-First Responsive Design
 """
 
 import flet as ft
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import threading
 import time
+import weakref
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 import asyncio
+import atexit
+import sys
+from bisect import bisect_right
 from web_config_const import *
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+# Online delay tiers ordered by threshold, resolved once for every card
+_DELAY_TIERS = sorted(
+    ((DELAY_CATEGORIES[k]["max_delay"], DELAY_CATEGORIES[k]) for k in ("EXCELLENT", "GOOD", "FAIR", "POOR")),
+    key=lambda tier: tier[0]
+)
+_DELAY_LIMITS = tuple(limit for limit, _ in _DELAY_TIERS)
+_DELAY_TIER_CATEGORIES = tuple(category for _, category in _DELAY_TIERS)
+_OFFLINE_CATEGORY = DELAY_CATEGORIES["OFFLINE"]
+
+# Desktop signal icon by delay: below 100, 300, 500 ms, and anything slower
+_SIGNAL_ICON_LIMITS = (100, 300, 500)
+_SIGNAL_ICONS = (
+    ft.Icons.SIGNAL_CELLULAR_ALT,
+    ft.Icons.SIGNAL_CELLULAR_ALT_2_BAR,
+    ft.Icons.SIGNAL_CELLULAR_ALT_1_BAR,
+    ft.Icons.SIGNAL_CELLULAR_0_BAR,
+)
+
+@lru_cache(maxsize=4096)
+def _format_time(timestamp: str, fmt: str) -> str:
+    """Format an ISO timestamp for display, memoized by raw string"""
+    if not timestamp:
+        return "N/A"
+    try:
+        return datetime.fromisoformat(timestamp).strftime(fmt)
+    except (TypeError, ValueError):
+        return "N/A"
+
+@lru_cache(maxsize=4096)
+def _display_name(name: str, max_length: int) -> str:
+    """Truncate a config name for display, once per name and length"""
+    return name[:max_length] + "..." if len(name) > max_length else name
+
+class ResultsFileHandler(FileSystemEventHandler):
+    """Wakes the results watcher when the results file is written"""
+    
+    def __init__(self, watcher: "ResultsWatcher", filename: str):
+        self.watcher = watcher
+        self.filename = filename
+    
+    def on_any_event(self, event):
+        # Only writes matter; our own reads would otherwise trigger open/close events
+        if event.event_type not in ("created", "modified", "moved"):
+            return
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if self.filename in (os.path.basename(p) for p in paths if p):
+            self.watcher.notify()
+
+class ResultsWatcher:
+    """Watches for result changes once per process and wakes every open dashboard"""
+    
+    def __init__(self):
+        self.dashboards = weakref.WeakSet()
+        self.observer = None
+        self.poll_task = None
+        self._lock = threading.Lock()
+        self._fail_count = 0  # Consecutive notify rounds that raised
+    
+    def subscribe(self, dashboard: "MonitorDashboard"):
+        """Add a dashboard, starting the watch for the first one"""
+        with self._lock:
+            self.dashboards.add(dashboard)
+            if self.observer is None and self.poll_task is None:
+                self._start(dashboard)
+    
+    def unsubscribe(self, dashboard: "MonitorDashboard"):
+        """Remove a dashboard, stopping the watch after the last one"""
+        with self._lock:
+            self.dashboards.discard(dashboard)
+            if not self.dashboards:
+                self._stop()
+    
+    def notify(self):
+        """Ask every dashboard whose view is stale to render"""
+        failed = None
+        # Sessions subscribe and unsubscribe from other threads, so copy the set under the lock
+        with self._lock:
+            dashboards = list(self.dashboards)
+        for dashboard in dashboards:
+            try:
+                if dashboard.results_changed():
+                    dashboard.request_render()
+            except Exception as e:
+                failed = e
+        
+        if failed is None:
+            self._fail_count = 0
+            return
+        self._fail_count += 1
+        # Log the 1st, 2nd, 4th, 8th... failing round in a row rather than every tick
+        if self._fail_count & (self._fail_count - 1) == 0:
+            logger.warning("Auto-refresh error (%d in a row): %s", self._fail_count, failed)
+    
+    def _start(self, dashboard: "MonitorDashboard"):
+        """Watch the results file on Linux, otherwise poll on the page event loop"""
+        if dashboard.shared_results is None and Observer is not None and sys.platform.startswith("linux"):
+            try:
+                self.observer = Observer()
+                handler = ResultsFileHandler(self, dashboard.results_file.name)
+                self.observer.schedule(handler, str(dashboard.results_file.resolve().parent))
+                self.observer.daemon = True
+                self.observer.start()
+                return
+            except Exception as e:
+                logger.warning("File watcher unavailable, polling instead: %s", e)
+                self.observer = None
+        
+        # Every session shares one loop, so the task outlives the page that started it
+        self.poll_task = dashboard.page.run_task(self.poll)
+    
+    def _stop(self):
+        """Stop watching"""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer = None
+        if self.poll_task is not None:
+            self.poll_task.cancel()
+            self.poll_task = None
+    
+    async def poll(self):
+        """Poll for result changes until the last dashboard goes away"""
+        interval, max_delay = AUTO_REFRESH_INTERVAL, MAX_REFRESH_BACKOFF
+        while True:
+            # One bad tick must not end polling for every session
+            try:
+                # Back off while loads keep failing instead of retrying at full rate
+                with self._lock:
+                    dashboards = list(self.dashboards)
+                failures = max((d._fail_count for d in dashboards), default=0)
+            except Exception as e:
+                logger.warning("Auto-refresh error: %s", e)
+                failures = 0
+            await asyncio.sleep(min(interval * 2 ** failures, max_delay))
+            try:
+                self.notify()
+            except Exception as e:
+                logger.warning("Auto-refresh error: %s", e)
+
+_watcher = ResultsWatcher()
+
 class MonitorDashboard:
     """Mobile-responsive monitoring dashboard using Flet"""
     
-    def __init__(self, page: ft.Page):
+    def __init__(self, page: ft.Page, shared_results=None, shared_version=None):
         self.page = page
         self.results_file = Path(PATHS.get("results_file", "./ping_results.json"))
+        self.shared_results = shared_results  # Live results from the monitor process, if any
+        self.shared_version = shared_version  # Bumped by the monitor on every change to shared_results
+        self._color_cache = {}
+        self._icon_cache = {}
         self.config_cards = {}
-        self.update_timer = None
+        self.card_parts = {}  # Mutable sub-controls of each card, by config name
+        self.prev_data = {}  # Result data each card currently shows
+        self._name_lower = {}  # Lowercased config names for search
+        self._visible_names = set()  # Cards currently passing the search filter
+        self.showing_message = False  # False, or the message currently shown instead of cards
+        self._results_cache_key = None  # (mtime_ns, size) of the last results file read, or the shared version
+        self._results_digest = None  # Content hash of the last results file parsed
+        self._results = {}
+        self._rendered_key = None  # (content digest, sort order) the cards currently show
+        self.main_content = None
         self.is_mobile = False
+        self._resize_timer = None
+        self.search_text = ""
+        self._dirty = False
+        self._last_render = 0.0
+        self._render_timer = None
+        self._search_timer = None
+        self._render_lock = threading.Lock()
+        self._state_lock = threading.RLock()  # Held by whatever is rebuilding or filling the cards
+        self._closed = False
+        self._hidden = False  # Browser tab or app window is in the background
+        self._loading = False
+        self._fail_count = 0  # Consecutive failed loads
+        self._update_pending = False
+        self._dirty_controls = set()  # Controls the next update covers; None for the whole page
+        self._update_lock = threading.Lock()
+        self._border_cache = {}
+        self._style_cache = {}  # Card style per delay bucket, shared by every card in it
+        self._header_gradient = ft.LinearGradient(
+            begin=ft.alignment.top_left,
+            end=ft.alignment.bottom_right,
+            colors=[
+                self._color(HEADER_GRADIENT["start_color"]),
+                self._color(HEADER_GRADIENT["end_color"])
+            ],
+        )
+        self._card_animation = ft.Animation(
+            duration=ANIMATIONS["card_hover_duration"],
+            curve=ft.AnimationCurve.EASE_IN_OUT,
+        )
+        self._hover_enabled = ADVANCED["enable_hover_effects"]
+        self._mobile_item_extent = MOBILE_CONFIG["card_height"] + MOBILE_CONFIG["card_spacing"]
+        self._theme_dark = self._build_theme(DARK_THEME)
+        self._theme_light = self._build_theme(LIGHT_THEME)
         self.setup_page()
         self.detect_screen_size()
         self.create_ui()
         
+    def _color(self, name: str) -> str:
+        """Resolve a color name from config, cached after the first lookup"""
+        color = self._color_cache.get(name)
+        if color is None:
+            color = self._color_cache[name] = getattr(ft.Colors, name)
+        return color
+    
+    def _icon(self, name: str) -> str:
+        """Resolve an icon name from config, cached after the first lookup"""
+        icon = self._icon_cache.get(name)
+        if icon is None:
+            icon = self._icon_cache[name] = getattr(ft.Icons, name)
+        return icon
+    
+    def _border(self, width: int, color: str, opacity: float = None) -> ft.Border:
+        """Card border for a color, built once and shared between cards"""
+        key = (width, color, opacity)
+        border = self._border_cache.get(key)
+        if border is None:
+            if opacity is not None:
+                color = ft.Colors.with_opacity(opacity, color)
+            border = self._border_cache[key] = ft.border.all(width, color)
+        return border
+    
+    def _build_theme(self, colors: Dict) -> ft.Theme:
+        """Build a page theme from a theme color config"""
+        return ft.Theme(
+            color_scheme=ft.ColorScheme(
+                primary=self._color(colors["primary"]),
+                primary_container=self._color(colors["primary_container"]),
+                secondary=self._color(colors["secondary"]),
+                background=self._color(colors["background"]),
+                surface=self._color(colors["surface"]),
+                on_primary=self._color(colors["on_primary"]),
+                on_secondary=self._color(colors["on_secondary"]),
+                on_background=self._color(colors["on_background"]),
+                on_surface=self._color(colors["on_surface"]),
+            )
+        )
+    
     def setup_page(self):
         """Configure page settings"""
         self.page.title = TEXT.get("app_title", "Xray Monitor")
@@ -38,61 +298,121 @@ class MonitorDashboard:
         self.page.window.height = None
         
         # Modern color scheme from config
-        self.page.theme = ft.Theme(
-            color_scheme=ft.ColorScheme(
-                primary=getattr(ft.Colors, DARK_THEME["primary"]),
-                primary_container=getattr(ft.Colors, DARK_THEME["primary_container"]),
-                secondary=getattr(ft.Colors, DARK_THEME["secondary"]),
-                background=getattr(ft.Colors, DARK_THEME["background"]),
-                surface=getattr(ft.Colors, DARK_THEME["surface"]),
-                on_primary=getattr(ft.Colors, DARK_THEME["on_primary"]),
-                on_secondary=getattr(ft.Colors, DARK_THEME["on_secondary"]),
-                on_background=getattr(ft.Colors, DARK_THEME["on_background"]),
-                on_surface=getattr(ft.Colors, DARK_THEME["on_surface"]),
-            )
-        )
+        self.page.theme = self._theme_dark
         
         # Add resize handler
         self.page.on_resize = self.on_page_resize
+        self.page.on_app_lifecycle_state_change = self.on_lifecycle_change
     
     def detect_screen_size(self):
         """Detect if we're on mobile based on screen width"""
-        if self.page.width and self.page.width < MOBILE_BREAKPOINT:
-            self.is_mobile = True
+        width = self.page.width
+        if not width:
+            return
+        
+        # Once a layout is built, require crossing the breakpoint by a margin so
+        # dragging the window edge around it doesn't flip layouts back and forth
+        margin = MOBILE_BREAKPOINT_HYSTERESIS if self.main_content is not None else 0
+        if self.is_mobile:
+            self.is_mobile = width < MOBILE_BREAKPOINT + margin
         else:
-            self.is_mobile = False
+            self.is_mobile = width < MOBILE_BREAKPOINT - margin
     
     def get_delay_category(self, delay: float, status: str) -> Dict:
         """Get category info based on delay and status"""
         if status != "online":
-            return DELAY_CATEGORIES["OFFLINE"]
-        
-        if delay < DELAY_CATEGORIES["EXCELLENT"]["max_delay"]:
-            return DELAY_CATEGORIES["EXCELLENT"]
-        elif delay < DELAY_CATEGORIES["GOOD"]["max_delay"]:
-            return DELAY_CATEGORIES["GOOD"]
-        elif delay < DELAY_CATEGORIES["FAIR"]["max_delay"]:
-            return DELAY_CATEGORIES["FAIR"]
+            return _OFFLINE_CATEGORY
+        
+        # First tier whose limit is above the delay; the last tier also takes anything beyond
+        return _DELAY_TIER_CATEGORIES[min(bisect_right(_DELAY_LIMITS, delay), len(_DELAY_LIMITS) - 1)]
+    
+    def _card_style(self, delay: float, status: str) -> tuple:
+        """Category, color, signal icon and card borders for a result's bucket"""
+        if status != "online":
+            key = None
         else:
-            return DELAY_CATEGORIES["POOR"]
+            key = (bisect_right(_DELAY_LIMITS, delay), bisect_right(_SIGNAL_ICON_LIMITS, delay))
+        style = self._style_cache.get(key)
+        if style is None:
+            category = self.get_delay_category(delay, status)
+            color = self._color(category["color"])
+            icon = ft.Icons.SIGNAL_CELLULAR_OFF if key is None else _SIGNAL_ICONS[key[1]]
+            style = self._style_cache[key] = (
+                category, color, icon, self._border(2, color), self._border(1, color, 0.3)
+            )
+        return style
     
     def on_page_resize(self, e):
-        """Handle page resize events"""
+        """Handle page resize events once the window settles"""
+        if self._resize_timer is not None:
+            self._resize_timer.cancel()
+        self._resize_timer = threading.Timer(RESIZE_DEBOUNCE_INTERVAL, self.apply_resize)
+        self._resize_timer.daemon = True
+        self._resize_timer.start()
+    
+    def on_lifecycle_change(self, e):
+        """Pause rendering while the page is in the background"""
+        if e.state in (ft.AppLifecycleState.HIDE, ft.AppLifecycleState.PAUSE):
+            self._hidden = True
+        elif e.state in (ft.AppLifecycleState.SHOW, ft.AppLifecycleState.RESUME):
+            self._hidden = False
+            # Catch up on changes that arrived while hidden, in one render
+            if self._dirty:
+                self.request_render()
+    
+    def apply_resize(self):
+        """Swap the layout if the settled width crossed the breakpoint"""
         old_is_mobile = self.is_mobile
         self.detect_screen_size()
         
-        # Rebuild UI if switching between mobile/desktop
+        # Rebuild UI if switching between mobile/desktop; never mid-render, or the
+        # render would fill the old host and mark the new, empty one as current
         if old_is_mobile != self.is_mobile:
-            self.page.controls.clear()
-            self.create_ui()
-            self.load_results()
+            with self._state_lock:
+                if not self._closed:
+                    self.create_ui()
     
     def create_ui(self):
         """Create responsive UI based on screen size"""
+        # Fresh containers need fresh cards
+        self.config_cards.clear()
+        self.card_parts.clear()
+        self.prev_data.clear()
+        self._name_lower.clear()
+        self._visible_names.clear()
+        self.showing_message = False
+        self.search_text = ""
+        self._rendered_key = None
+        
+        # Message views are sized for one layout, build them again on demand
+        self._sizes = MESSAGE_SIZES["mobile" if self.is_mobile else "desktop"]
+        self._no_data_view = None
+        self._error_view = None
+        self._error_text = None
+        
+        self.stat_texts = []  # Value texts of the stat cards, filled in as they are built
+        layout = self.create_mobile_ui() if self.is_mobile else self.create_desktop_ui()
+        
+        # Bind the card area and card builders for this layout once instead of
+        # branching on every refresh, and let the other layout's tree go
         if self.is_mobile:
-            self.create_mobile_ui()
+            self.cards_host, self.configs_grid = self.configs_container, None
+            self._create_card, self._update_card = self.create_mobile_config_card, self.update_mobile_config_card
+        else:
+            self.cards_host, self.configs_container = self.configs_grid, None
+            self._create_card, self._update_card = self.create_config_card, self.update_config_card
+        
+        # Keep one root column and swap its children, so a layout change
+        # re-lays out that subtree instead of the whole page
+        if self.main_content is None:
+            self.main_content = ft.Column(layout, spacing=0, expand=True)
+            self.page.add(self.main_content)
         else:
-            self.create_desktop_ui()
+            self.main_content.controls = layout
+            self.schedule_update()
+        
+        self.start_auto_refresh()
+        self.request_render()
     
     def create_mobile_ui(self):
         """Create mobile-optimized UI"""
@@ -124,14 +444,7 @@ class MonitorDashboard:
                 ),
             ], spacing=5),
             padding=ft.padding.all(MOBILE_CONFIG["header_padding"]),
-            gradient=ft.LinearGradient(
-                begin=ft.alignment.top_left,
-                end=ft.alignment.bottom_right,
-                colors=[
-                    getattr(ft.Colors, HEADER_GRADIENT["start_color"]),
-                    getattr(ft.Colors, HEADER_GRADIENT["end_color"])
-                ],
-            ),
+            gradient=self._header_gradient,
         )
         
         # Horizontal scrollable stats for mobile
@@ -139,23 +452,23 @@ class MonitorDashboard:
             [
                 self.create_mobile_stat_card(
                     STAT_CARDS["total"]["title_mobile"], "0",
-                    getattr(ft.Icons, STAT_CARDS["total"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["total"]["color"])
+                    self._icon(STAT_CARDS["total"]["icon"]),
+                    self._color(STAT_CARDS["total"]["color"])
                 ),
                 self.create_mobile_stat_card(
                     STAT_CARDS["online"]["title_mobile"], "0",
-                    getattr(ft.Icons, STAT_CARDS["online"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["online"]["color"])
+                    self._icon(STAT_CARDS["online"]["icon"]),
+                    self._color(STAT_CARDS["online"]["color"])
                 ),
                 self.create_mobile_stat_card(
                     STAT_CARDS["offline"]["title_mobile"], "0",
-                    getattr(ft.Icons, STAT_CARDS["offline"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["offline"]["color"])
+                    self._icon(STAT_CARDS["offline"]["icon"]),
+                    self._color(STAT_CARDS["offline"]["color"])
                 ),
                 self.create_mobile_stat_card(
                     STAT_CARDS["average"]["title_mobile"], "0ms",
-                    getattr(ft.Icons, STAT_CARDS["average"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["average"]["color"])
+                    self._icon(STAT_CARDS["average"]["icon"]),
+                    self._color(STAT_CARDS["average"]["color"])
                 ),
             ],
             scroll=ft.ScrollMode.HIDDEN,
@@ -192,14 +505,15 @@ class MonitorDashboard:
         )
         
         # Configs list for mobile (single column)
-        self.configs_container = ft.Column(
-            scroll=ft.ScrollMode.ADAPTIVE,
-            spacing=10,
+        # Virtualized list: only cards scrolled into view are built, and the
+        # fixed extent lets Flet lay out rows without measuring each one
+        self.configs_container = ft.ListView(
+            item_extent=self._mobile_item_extent,
             expand=True,
         )
         
         # Main mobile layout
-        self.main_content = ft.Column([
+        return [
             self.header,
             ft.Container(
                 content=self.stats_row,
@@ -217,11 +531,7 @@ class MonitorDashboard:
                 padding=ft.padding.all(10),
                 expand=True,
             ),
-        ], spacing=0, expand=True)
-        
-        self.page.add(self.main_content)
-        self.start_auto_refresh()
-        self.load_results()
+        ]
     
     def create_desktop_ui(self):
         """Create desktop UI (original design)"""
@@ -257,14 +567,7 @@ class MonitorDashboard:
                 ], spacing=10),
             ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
             padding=ft.padding.symmetric(horizontal=30, vertical=20),
-            gradient=ft.LinearGradient(
-                begin=ft.alignment.top_left,
-                end=ft.alignment.bottom_right,
-                colors=[
-                    getattr(ft.Colors, HEADER_GRADIENT["start_color"]),
-                    getattr(ft.Colors, HEADER_GRADIENT["end_color"])
-                ],
-            ),
+            gradient=self._header_gradient,
         )
         
         # Desktop stats
@@ -272,23 +575,23 @@ class MonitorDashboard:
             [
                 self.create_stat_card(
                     STAT_CARDS["total"]["title"], "0",
-                    getattr(ft.Icons, STAT_CARDS["total"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["total"]["color"])
+                    self._icon(STAT_CARDS["total"]["icon"]),
+                    self._color(STAT_CARDS["total"]["color"])
                 ),
                 self.create_stat_card(
                     STAT_CARDS["online"]["title"], "0",
-                    getattr(ft.Icons, STAT_CARDS["online"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["online"]["color"])
+                    self._icon(STAT_CARDS["online"]["icon"]),
+                    self._color(STAT_CARDS["online"]["color"])
                 ),
                 self.create_stat_card(
                     STAT_CARDS["offline"]["title"], "0",
-                    getattr(ft.Icons, STAT_CARDS["offline"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["offline"]["color"])
+                    self._icon(STAT_CARDS["offline"]["icon"]),
+                    self._color(STAT_CARDS["offline"]["color"])
                 ),
                 self.create_stat_card(
                     STAT_CARDS["average"]["title"], "0ms",
-                    getattr(ft.Icons, STAT_CARDS["average"]["icon"]),
-                    getattr(ft.Colors, STAT_CARDS["average"]["color"])
+                    self._icon(STAT_CARDS["average"]["icon"]),
+                    self._color(STAT_CARDS["average"]["color"])
                 ),
             ],
             alignment=ft.MainAxisAlignment.SPACE_AROUND,
@@ -328,8 +631,12 @@ class MonitorDashboard:
         )
         
         # Desktop grid view
+        # Cards are built lazily as they scroll in, with only a small margin
+        # kept off screen, so large grids cost about as much as visible ones
         self.configs_grid = ft.GridView(
             expand=True,
+            build_controls_on_demand=True,
+            cache_extent=DESKTOP_GRID["cache_extent"],
             runs_count=DESKTOP_GRID["columns"],
             max_extent=DESKTOP_GRID["max_card_width"],
             child_aspect_ratio=DESKTOP_GRID["card_aspect_ratio"],
@@ -339,7 +646,7 @@ class MonitorDashboard:
         )
         
         # Desktop layout
-        self.main_content = ft.Column([
+        return [
             self.header,
             ft.Container(
                 content=self.stats_row,
@@ -347,23 +654,21 @@ class MonitorDashboard:
             ),
             self.filter_bar,
             self.configs_grid,
-        ], spacing=0, expand=True)
-        
-        self.page.add(self.main_content)
-        self.start_auto_refresh()
-        self.load_results()
+        ]
     
     def create_mobile_stat_card(self, title: str, value: str, icon, color) -> ft.Container:
         """Create compact statistics card for mobile"""
+        value_text = ft.Text(
+            value,
+            size=18,
+            weight=ft.FontWeight.BOLD,
+            color=ft.Colors.WHITE,
+        )
+        self.stat_texts.append(value_text)
         return ft.Container(
             content=ft.Column([
                 ft.Icon(icon, size=20, color=color),
-                ft.Text(
-                    value,
-                    size=18,
-                    weight=ft.FontWeight.BOLD,
-                    color=ft.Colors.WHITE,
-                ),
+                value_text,
                 ft.Text(
                     title,
                     size=11,
@@ -382,83 +687,75 @@ class MonitorDashboard:
                     ft.Colors.with_opacity(0.02, color),
                 ],
             ),
-            border=ft.border.all(1, ft.Colors.with_opacity(0.2, color)),
+            border=self._border(1, color, 0.2),
         )
     
     def create_mobile_config_card(self, name: str, data: Dict) -> ft.Container:
         """Create mobile-optimized config card"""
+        # Keep references to the parts that change between refreshes
+        parts = {
+            "status_bar": ft.Container(
+                width=4,
+                height=MOBILE_CONFIG["card_height"],
+                border_radius=ft.border_radius.only(top_left=10, bottom_left=10),
+            ),
+            "quality_text": ft.Text(size=11, color=ft.Colors.WHITE),
+            "delay_text": ft.Text(size=12, weight=ft.FontWeight.BOLD),
+            "time_text": ft.Text(size=11, color=ft.Colors.GREY_400),
+        }
+        parts["quality_badge"] = ft.Container(
+            content=parts["quality_text"],
+            padding=ft.padding.symmetric(horizontal=8, vertical=2),
+            border_radius=10,
+        )
+        
+        # One flat row keeps the per-card tree (and each update sent to the client) small
+        parts["card"] = ft.Container(
+            content=ft.Row([
+                parts["status_bar"],
+                ft.Text(
+                    _display_name(name, ADVANCED["max_config_name_length_mobile"]),
+                    size=14,
+                    weight=ft.FontWeight.W_500,
+                    color=ft.Colors.WHITE,
+                    max_lines=1,
+                    overflow=ft.TextOverflow.ELLIPSIS,
+                    expand=True,
+                ),
+                parts["quality_badge"],
+                parts["delay_text"],
+                parts["time_text"],
+            ], spacing=8),
+            bgcolor=ft.Colors.GREY_800,
+            border_radius=10,
+            padding=ft.padding.only(right=10),
+            margin=ft.margin.only(left=5, right=5, bottom=MOBILE_CONFIG["card_spacing"]),
+        )
+        
+        self.card_parts[name] = parts
+        self.update_mobile_config_card(name, data)
+        return parts["card"]
+    
+    def update_mobile_config_card(self, name: str, data: Dict):
+        """Apply result data to an existing mobile card"""
+        parts = self.card_parts[name]
         delay = data.get("delay", 9999)
         status = data.get("status", "unknown")
         timestamp = data.get("timestamp", "")
         
         # Get category info from config
-        category = self.get_delay_category(delay, status)
-        border_color = getattr(ft.Colors, category["color"])
-        status_color = border_color
-        quality = category["quality_text"]
+        category, status_color, _, _, border = self._card_style(delay, status)
         
         # Format timestamp
-        try:
-            dt = datetime.fromisoformat(timestamp)
-            time_str = dt.strftime("%H:%M")
-        except:
-            time_str = "N/A"
-        
-        # Truncate name based on config
-        max_length = ADVANCED["max_config_name_length_mobile"]
-        display_name = name[:max_length] + "..." if len(name) > max_length else name
+        time_str = _format_time(timestamp, "%H:%M")
         
-        return ft.Container(
-            content=ft.Row([
-                # Status indicator
-                ft.Container(
-                    width=4,
-                    height=60,
-                    bgcolor=status_color,
-                    border_radius=ft.border_radius.only(top_left=10, bottom_left=10),
-                ),
-                # Main content
-                ft.Container(
-                    content=ft.Column([
-                        ft.Text(
-                            display_name,
-                            size=14,
-                            weight=ft.FontWeight.W_500,
-                            color=ft.Colors.WHITE,
-                        ),
-                        ft.Row([
-                            ft.Container(
-                                content=ft.Text(
-                                    quality,
-                                    size=11,
-                                    color=ft.Colors.WHITE,
-                                ),
-                                padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                                bgcolor=status_color,
-                                border_radius=10,
-                            ),
-                            ft.Text(
-                                f"{delay:.0f}ms" if delay < ADVANCED["offline_delay_threshold"] else "N/A",
-                                size=12,
-                                weight=ft.FontWeight.BOLD,
-                                color=status_color,
-                            ),
-                            ft.Text(
-                                time_str,
-                                size=11,
-                                color=ft.Colors.GREY_400,
-                            ),
-                        ], spacing=10),
-                    ], spacing=5),
-                    expand=True,
-                    padding=ft.padding.all(10),
-                ),
-            ], spacing=0),
-            bgcolor=ft.Colors.GREY_800,
-            border_radius=10,
-            border=ft.border.all(1, ft.Colors.with_opacity(0.3, border_color)),
-            margin=ft.margin.symmetric(horizontal=5),
-        )
+        parts["status_bar"].bgcolor = status_color
+        parts["quality_badge"].bgcolor = status_color
+        parts["quality_text"].value = category["quality_text"]
+        parts["delay_text"].value = f"{delay:.0f}ms" if delay < ADVANCED["offline_delay_threshold"] else "N/A"
+        parts["delay_text"].color = status_color
+        parts["time_text"].value = time_str
+        parts["card"].border = border
     
     def create_status_indicator(self) -> ft.Container:
         """Create a status indicator widget"""
@@ -480,18 +777,20 @@ class MonitorDashboard:
     
     def create_stat_card(self, title: str, value: str, icon: str, color: str) -> ft.Container:
         """Create desktop statistics card"""
+        value_text = ft.Text(
+            value,
+            size=32,
+            weight=ft.FontWeight.BOLD,
+            color=ft.Colors.WHITE,
+        )
+        self.stat_texts.append(value_text)
         return ft.Container(
             content=ft.Column([
                 ft.Row([
                     ft.Icon(icon, size=24, color=color),
                     ft.Text(title, size=14, color=ft.Colors.GREY_400),
                 ], alignment=ft.MainAxisAlignment.START),
-                ft.Text(
-                    value,
-                    size=32,
-                    weight=ft.FontWeight.BOLD,
-                    color=ft.Colors.WHITE,
-                ),
+                value_text,
             ], spacing=10),
             padding=ft.padding.all(20),
             border_radius=15,
@@ -505,58 +804,34 @@ class MonitorDashboard:
                     ft.Colors.with_opacity(0.02, color),
                 ],
             ),
-            border=ft.border.all(1, ft.Colors.with_opacity(0.2, color)),
+            border=self._border(1, color, 0.2),
         )
     
     def create_config_card(self, name: str, data: Dict) -> ft.Container:
         """Create desktop configuration card"""
-        delay = data.get("delay", 9999)
-        status = data.get("status", "unknown")
-        timestamp = data.get("timestamp", "")
+        # Keep references to the parts that change between refreshes
+        parts = {
+            "status_icon": ft.Icon(size=28),
+            "quality_text": ft.Text(size=12),
+            "delay_text": ft.Text(size=14, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
+            "time_text": ft.Text(size=14, color=ft.Colors.WHITE),
+            "progress": ft.ProgressBar(bgcolor=ft.Colors.GREY_800, height=6),
+        }
         
-        category = self.get_delay_category(delay, status)
-        border_color = getattr(ft.Colors, category["color"])
-        status_color = border_color
-        quality = category["quality_text"]
-        
-        # تعیین آیکون بر اساس وضعیت و کیفیت
-        if status != "online":
-            status_icon = ft.Icons.SIGNAL_CELLULAR_OFF
-        else:
-            if delay < 100:
-                status_icon = ft.Icons.SIGNAL_CELLULAR_ALT
-            elif delay < 300:
-                status_icon = ft.Icons.SIGNAL_CELLULAR_ALT_2_BAR
-            elif delay < 500:
-                status_icon = ft.Icons.SIGNAL_CELLULAR_ALT_1_BAR
-            else:
-                status_icon = ft.Icons.SIGNAL_CELLULAR_0_BAR
-
-        # Format timestamp
-        try:
-            dt = datetime.fromisoformat(timestamp)
-            time_str = dt.strftime("%H:%M:%S")
-        except:
-            time_str = "N/A"
-
-        card = ft.Container(
+        parts["card"] = ft.Container(
             content=ft.Column([
                 # Header
                 ft.Row([
-                    ft.Icon(status_icon, size=28, color=status_color),
+                    parts["status_icon"],
                     ft.Column([
                         ft.Text(
-                            name[:30] + "..." if len(name) > 30 else name,
+                            _display_name(name, ADVANCED["max_config_name_length"]),
                             size=16,
                             weight=ft.FontWeight.W_500,
                             color=ft.Colors.WHITE,
                             tooltip=name,
                         ),
-                        ft.Text(
-                            quality,
-                            size=12,
-                            color=status_color,
-                        ),
+                        parts["quality_text"],
                     ], expand=True, spacing=2),
                 ], alignment=ft.MainAxisAlignment.START, spacing=15),
                 
@@ -567,278 +842,476 @@ class MonitorDashboard:
                     ft.Row([
                         ft.Icon(ft.Icons.SPEED, size=16, color=ft.Colors.GREY_400),
                         ft.Text("Delay:", size=14, color=ft.Colors.GREY_400),
-                        ft.Text(
-                            f"{delay:.0f}ms" if delay < ADVANCED["offline_delay_threshold"] else "N/A",
-                            size=14,
-                            weight=ft.FontWeight.BOLD,
-                            color=ft.Colors.WHITE,
-                        ),
+                        parts["delay_text"],
                     ], alignment=ft.MainAxisAlignment.START, spacing=8),
                     
                     ft.Row([
                         ft.Icon(ft.Icons.ACCESS_TIME, size=16, color=ft.Colors.GREY_400),
                         ft.Text("Last Test:", size=14, color=ft.Colors.GREY_400),
-                        ft.Text(time_str, size=14, color=ft.Colors.WHITE),
+                        parts["time_text"],
                     ], alignment=ft.MainAxisAlignment.START, spacing=8),
                 ], spacing=10),
                 
                 # Progress bar
                 ft.Container(
-                    content=ft.ProgressBar(
-                        value=max(0, min(1, 1 - (delay / 1000))) if delay < 9999 else 0,
-                        color=status_color,
-                        bgcolor=ft.Colors.GREY_800,
-                        height=6,
-                    ),
+                    content=parts["progress"],
                     margin=ft.margin.only(top=10),
                 ),
             ], spacing=10),
             padding=ft.padding.all(20),
             border_radius=15,
             bgcolor=ft.Colors.GREY_800,
-            border=ft.border.all(2, border_color),
-            animate=ft.Animation(duration=300, curve=ft.AnimationCurve.EASE_IN_OUT),
-            on_hover=self.on_card_hover,
         )
         
-        return card
+        # Every hovered card costs an animation and a round trip, so big grids go without
+        if self._hover_enabled:
+            self._set_card_hover(parts["card"], True)
+        
+        self.card_parts[name] = parts
+        self.update_config_card(name, data)
+        return parts["card"]
+    
+    def update_config_card(self, name: str, data: Dict):
+        """Apply result data to an existing desktop card"""
+        parts = self.card_parts[name]
+        delay = data.get("delay", 9999)
+        status = data.get("status", "unknown")
+        timestamp = data.get("timestamp", "")
+        
+        # تعیین آیکون بر اساس وضعیت و کیفیت
+        category, status_color, status_icon, border, _ = self._card_style(delay, status)
+        
+        # Format timestamp
+        time_str = _format_time(timestamp, "%H:%M:%S")
+        
+        parts["status_icon"].name = status_icon
+        parts["status_icon"].color = status_color
+        parts["quality_text"].value = category["quality_text"]
+        parts["quality_text"].color = status_color
+        parts["delay_text"].value = f"{delay:.0f}ms" if delay < ADVANCED["offline_delay_threshold"] else "N/A"
+        parts["time_text"].value = time_str
+        parts["progress"].value = max(0, min(1, 1 - (delay / 1000))) if delay < 9999 else 0
+        parts["progress"].color = status_color
+        parts["card"].border = border
+    
+    def _set_card_hover(self, card: ft.Container, enabled: bool):
+        """Attach or detach the hover effect of a desktop card"""
+        if enabled:
+            card.animate = self._card_animation
+            card.on_hover = self.on_card_hover
+        else:
+            card.animate = None
+            card.on_hover = None
+            if card.scale is not None:
+                # Don't leave a card stuck in its hovered look
+                card.elevation = 0
+                card.scale = 1.0
     
     def on_card_hover(self, e):
         """Handle card hover effect (desktop only)"""
         if not self.is_mobile:
-            if e.data == "true":
-                e.control.elevation = 10
-                e.control.scale = 1.02
-            else:
-                e.control.elevation = 0
-                e.control.scale = 1.0
-            self.page.update()
+            scale = 1.02 if e.data == "true" else 1.0
+            if e.control.scale == scale:
+                return  # Repeated enter/leave event, nothing to send
+            e.control.elevation = 10 if scale != 1.0 else 0
+            e.control.scale = scale
+            e.control.update()
     
     def load_results(self):
         """Load and display results from file"""
         try:
-            if not self.results_file.exists():
+            loaded = self._load_results_io()
+            if loaded is None:
                 self.show_no_data()
                 return
+            results, digest = loaded
             
-            with open(self.results_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            results = data.get("results", {})
-            
-            if not results:
-                self.show_no_data()
-                return
-            
-            # Update statistics
-            self.update_statistics(results)
-            
-            # Clear and rebuild config cards
-            if self.is_mobile:
-                self.configs_container.controls.clear()
-            else:
-                self.configs_grid.controls.clear()
-            self.config_cards.clear()
-            
-            # Sort results
-            sorted_results = self.sort_results(results, self.sort_dropdown.value)
-            
-            # Create cards based on view type
-            for name, config_data in sorted_results:
-                if self.is_mobile:
-                    card = self.create_mobile_config_card(name, config_data)
-                    self.config_cards[name] = card
-                    self.configs_container.controls.append(card)
-                else:
-                    card = self.create_config_card(name, config_data)
-                    self.config_cards[name] = card
-                    self.configs_grid.controls.append(card)
-            
-            self.page.update()
+            # Same content in the same order is already on screen
+            render_key = (digest, self.sort_dropdown.value)
+            if render_key != self._rendered_key:
+                self._apply_results(results, self.sort_results(results, self.sort_dropdown.value))
+                self._rendered_key = render_key
+            self._fail_count = 0
             
         except Exception as e:
-            print(f"Error loading results: {e}")
+            self._fail_count += 1
+            # Log the 1st, 2nd, 4th, 8th... failure in a row rather than every one
+            if self._fail_count & (self._fail_count - 1) == 0:
+                logger.warning("Error loading results (%d in a row): %s", self._fail_count, e)
             self.show_error(str(e))
     
+    def _load_results_io(self) -> Optional[tuple]:
+        """Read and parse results without touching any control; None if there is no data"""
+        if self.shared_results is not None:
+            # Read the monitor's live results directly instead of the JSON snapshot,
+            # copying them only when the monitor has published a newer version
+            version = self.shared_version.value if self.shared_version is not None else None
+            if version is not None and version == self._results_cache_key:
+                digest = self._results_digest
+            else:
+                self._results = self.shared_results.copy()
+                self._results_digest = digest = hashlib.blake2b(_dumps(self._results), digest_size=16).digest()
+                self._results_cache_key = version
+            results = self._results
+        else:
+            try:
+                st = self.results_file.stat()
+            except FileNotFoundError:
+                self._results_cache_key = None
+                return None
+            
+            if (st.st_mtime_ns, st.st_size) == self._results_cache_key:
+                # Re-render (sort change, new layout) of an untouched file: no read at all
+                digest = self._results_digest
+            else:
+                with open(self.results_file, 'rb') as f:
+                    st = os.fstat(f.fileno())
+                    raw = f.read()
+                
+                # A rewrite with identical bytes reuses the last parse
+                digest = hashlib.blake2b(raw, digest_size=16).digest()
+                if digest != self._results_digest:
+                    self._results = _loads(raw).get("results", {})
+                    self._results_digest = digest
+                # Only remember the file once it parsed, so a bad write is retried
+                self._results_cache_key = (st.st_mtime_ns, st.st_size)
+            results = self._results
+        
+        if not results:
+            return None
+        
+        return results, digest
+    
+    def _apply_results(self, results: Dict, sorted_results: List):
+        """Apply loaded results to the cards, touching only what changed"""
+        container = self.cards_host
+        structural = False  # Cards added, removed or moved: the container has to be sent
+        updated = []
+        
+        # Cards replace a "no data" / error message in the reorder step below
+        if self.showing_message:
+            if self.is_mobile:
+                container.item_extent = self._mobile_item_extent
+            self.showing_message = False
+            structural = True
+        
+        # Drop cards for configs that are gone
+        for name in [n for n in self.config_cards if n not in results]:
+            del self.config_cards[name]
+            del self.card_parts[name]
+            self.prev_data.pop(name, None)
+            del self._name_lower[name]
+            self._visible_names.discard(name)
+            structural = True
+        
+        # Crossing the card cap switches hover on or off for the cards already built too
+        hover_enabled = ADVANCED["enable_hover_effects"] and len(results) <= ADVANCED["hover_effects_max_cards"]
+        if hover_enabled != self._hover_enabled:
+            self._hover_enabled = hover_enabled
+            if not self.is_mobile and self.config_cards:
+                for card in self.config_cards.values():
+                    self._set_card_hover(card, hover_enabled)
+                structural = True
+        
+        # Create cards for new configs, update only the ones whose data changed
+        for name, config_data in results.items():
+            if name not in self.config_cards:
+                card = self._create_card(name, config_data)
+                # Keep the active search applied to new cards
+                name_lower = self._name_lower[name] = name.lower()
+                card.visible = self.search_text in name_lower
+                if card.visible:
+                    self._visible_names.add(name)
+                self.config_cards[name] = card
+                structural = True
+            elif self.prev_data.get(name) != config_data:
+                self._update_card(name, config_data)
+                updated.append(self.config_cards[name])
+            self.prev_data[name] = config_data
+        
+        # Reorder existing cards only when the sorted order moved
+        ordered = [self.config_cards[name] for name, _ in sorted_results]
+        if len(ordered) != len(container.controls) or any(a is not b for a, b in zip(ordered, container.controls)):
+            container.controls = ordered
+            structural = True
+        
+        if structural or updated:
+            stats = self.update_statistics(results)
+            # The container's update already covers every card inside it
+            self.schedule_update(*stats, *([container] if structural else updated))
+    
     def sort_results(self, results: Dict, sort_by: str) -> List:
         """Sort results based on selected criteria"""
-        items = list(results.items())
-        
         if sort_by == "name":
-            items.sort(key=lambda x: x[0])
-        elif sort_by == "delay":
-            items.sort(key=lambda x: x[1].get("delay", 9999))
+            return sorted(results.items(), key=itemgetter(0))
+        
+        # Decorate once so the sort compares plain tuples instead of calling .get per comparison
+        decorated = [
+            (r.get("delay", 9999), r.get("status", "unknown"), name, r)
+            for name, r in results.items()
+        ]
+        if sort_by == "delay":
+            decorated.sort(key=itemgetter(0))
         elif sort_by == "delay_desc":
-            items.sort(key=lambda x: x[1].get("delay", 9999), reverse=True)
+            decorated.sort(key=itemgetter(0), reverse=True)
         elif sort_by == "status":
-            items.sort(key=lambda x: (x[1].get("status", "unknown"), x[1].get("delay", 9999)))
+            decorated.sort(key=itemgetter(1, 0))
         
-        return items
+        return [(name, r) for _, _, name, r in decorated]
     
-    def update_statistics(self, results: Dict):
+    def update_statistics(self, results: Dict) -> List:
         """Update statistics cards"""
         total = len(results)
-        online = sum(1 for r in results.values() if r.get("status") == "online")
+        online = 0
+        delay_sum = 0.0
+        delay_count = 0
+        for r in results.values():
+            if r.get("status") == "online":
+                online += 1
+                delay = r.get("delay", 9999)
+                if delay < 9999:
+                    delay_sum += delay
+                    delay_count += 1
         offline = total - online
+        avg_delay = delay_sum / delay_count if delay_count else 0
         
-        delays = [r.get("delay", 0) for r in results.values() if r.get("status") == "online" and r.get("delay", 9999) < 9999]
-        avg_delay = sum(delays) / len(delays) if delays else 0
+        # Only touch values that changed, and report those
+        values = (str(total), str(online), str(offline), f"{avg_delay:.0f}ms")
+        changed = []
+        for text, value in zip(self.stat_texts, values):
+            if text.value != value:
+                text.value = value
+                changed.append(text)
+        return changed
+    
+    def schedule_update(self, *controls):
+        """Queue one update for the given controls, or the whole page if none are given"""
+        with self._update_lock:
+            if not controls:
+                self._dirty_controls = None
+            elif self._dirty_controls is not None:
+                self._dirty_controls.update(controls)
+            if self._update_pending:
+                return
+            self._update_pending = True
+        self.page.run_task(self._push_update)
+    
+    async def _push_update(self):
+        """Send all pending control changes to the client in one update"""
+        await asyncio.sleep(0)  # Let mutations queued in this loop tick join the batch
+        with self._update_lock:
+            # Changes made from here on need another update
+            self._update_pending = False
+            controls, self._dirty_controls = self._dirty_controls, set()
         
-        # Update stat cards based on view type
-        if self.is_mobile:
-            self.stats_row.controls[0].content.controls[1].value = str(total)
-            self.stats_row.controls[1].content.controls[1].value = str(online)
-            self.stats_row.controls[2].content.controls[1].value = str(offline)
-            self.stats_row.controls[3].content.controls[1].value = f"{avg_delay:.0f}ms"
-        else:
-            self.stats_row.controls[0].content.controls[1].value = str(total)
-            self.stats_row.controls[1].content.controls[1].value = str(online)
-            self.stats_row.controls[2].content.controls[1].value = str(offline)
-            self.stats_row.controls[3].content.controls[1].value = f"{avg_delay:.0f}ms"
+        if controls is None:
+            self.page.update()
+            return
+        # Cards added or dropped since they were marked ride on their container's update
+        index = self.page.index
+        controls = [c for c in controls if c.uid in index]
+        if controls:
+            self.page.update(*controls)
+    
+    def request_render(self):
+        """Mark the view dirty and schedule a single coalesced render"""
+        with self._render_lock:
+            if self._closed:
+                return
+            self._dirty = True
+            if self._render_timer:
+                self._render_timer.cancel()
+            self._render_timer = threading.Timer(RENDER_THROTTLE_INTERVAL, self._flush)
+            self._render_timer.daemon = True
+            self._render_timer.start()
+    
+    def _flush(self):
+        """Render pending changes, at most once per throttle interval"""
+        with self._render_lock:
+            if not self._dirty or self._closed:
+                return
+            if self._hidden:
+                return  # Stays dirty; on_lifecycle_change renders once the page is shown
+            wait = RENDER_THROTTLE_INTERVAL - (time.monotonic() - self._last_render)
+            if self._loading:
+                # A slow load is still running; render again once it is done
+                wait = RENDER_THROTTLE_INTERVAL
+            if wait > 0:
+                self._render_timer = threading.Timer(wait, self._flush)
+                self._render_timer.daemon = True
+                self._render_timer.start()
+                return
+            self._dirty = False
+            self._loading = True
+            self._last_render = time.monotonic()
+        
+        # Runs on the timer thread, so file I/O and parsing never block the UI
+        try:
+            with self._state_lock:
+                if not self._closed:  # The session may have closed while this waited
+                    self.load_results()
+        finally:
+            with self._render_lock:
+                self._loading = False
     
     def filter_configs(self, e):
-        """Filter configurations based on search text"""
+        """Filter configurations based on search text, debounced while typing"""
         search_text = e.control.value.lower()
+        if search_text == self.search_text:
+            return  # Same filter already applied or pending (e.g. a case-only edit)
+        self.search_text = search_text
         
-        for name, card in self.config_cards.items():
-            if search_text in name.lower():
-                card.visible = True
+        if self._search_timer:
+            self._search_timer.cancel()
+        self._search_timer = threading.Timer(SEARCH_DEBOUNCE_INTERVAL, self.apply_filter)
+        self._search_timer.daemon = True
+        self._search_timer.start()
+    
+    def apply_filter(self):
+        """Show only the cards matching the current search text"""
+        # Runs on the debounce timer; renders and layout rebuilds change the same card maps
+        with self._state_lock:
+            if self._closed:
+                return
+            query = self.search_text
+            if query:
+                visible = {name for name, name_lower in self._name_lower.items() if query in name_lower}
             else:
+                visible = set(self._name_lower)  # Cleared search shows everything, no matching needed
+            
+            # Only toggle the cards whose visibility actually changed
+            hidden = self._visible_names - visible
+            shown = visible - self._visible_names
+            toggled = []
+            for name in hidden:
+                card = self.config_cards[name]
                 card.visible = False
-        
-        self.page.update()
+                toggled.append(card)
+            for name in shown:
+                card = self.config_cards[name]
+                card.visible = True
+                toggled.append(card)
+            self._visible_names = visible
+            
+            if toggled:
+                self.schedule_update(*toggled)
     
     def sort_configs(self, e):
         """Sort configurations based on selected criteria"""
-        self.load_results()
+        self.request_render()
     
     def toggle_theme(self, e):
         """Toggle between light and dark theme"""
+        # Flet re-themes live controls, so only the theme and the button icon change
         if self.page.theme_mode == ft.ThemeMode.DARK:
             self.page.theme_mode = ft.ThemeMode.LIGHT
+            self.page.theme = self._theme_light
             e.control.icon = ft.Icons.DARK_MODE
-            
-            # Update theme colors for light mode from config
-            self.page.theme = ft.Theme(
-                color_scheme=ft.ColorScheme(
-                    primary=getattr(ft.Colors, LIGHT_THEME["primary"]),
-                    primary_container=getattr(ft.Colors, LIGHT_THEME["primary_container"]),
-                    secondary=getattr(ft.Colors, LIGHT_THEME["secondary"]),
-                    background=getattr(ft.Colors, LIGHT_THEME["background"]),
-                    surface=getattr(ft.Colors, LIGHT_THEME["surface"]),
-                    on_primary=getattr(ft.Colors, LIGHT_THEME["on_primary"]),
-                    on_secondary=getattr(ft.Colors, LIGHT_THEME["on_secondary"]),
-                    on_background=getattr(ft.Colors, LIGHT_THEME["on_background"]),
-                    on_surface=getattr(ft.Colors, LIGHT_THEME["on_surface"]),
-                )
-            )
         else:
             self.page.theme_mode = ft.ThemeMode.DARK
+            self.page.theme = self._theme_dark
             e.control.icon = ft.Icons.LIGHT_MODE
-            
-            # Reset to dark theme from config
-            self.page.theme = ft.Theme(
-                color_scheme=ft.ColorScheme(
-                    primary=getattr(ft.Colors, DARK_THEME["primary"]),
-                    primary_container=getattr(ft.Colors, DARK_THEME["primary_container"]),
-                    secondary=getattr(ft.Colors, DARK_THEME["secondary"]),
-                    background=getattr(ft.Colors, DARK_THEME["background"]),
-                    surface=getattr(ft.Colors, DARK_THEME["surface"]),
-                    on_primary=getattr(ft.Colors, DARK_THEME["on_primary"]),
-                    on_secondary=getattr(ft.Colors, DARK_THEME["on_secondary"]),
-                    on_background=getattr(ft.Colors, DARK_THEME["on_background"]),
-                    on_surface=getattr(ft.Colors, DARK_THEME["on_surface"]),
-                )
-            )
         
-        self.page.update()
-        self.page.controls.clear()
-        self.create_ui()
-        self.load_results()
+        self.schedule_update()
     
-    def show_no_data(self):
-        """Show no data message"""
-        no_data_container = ft.Container(
+    def _build_message(self, icon: str, title: str, message: str, color: str) -> tuple:
+        """Build a centered message view; returns it with its message text"""
+        message_text = ft.Text(
+            message,
+            size=self._sizes["message_body"],
+            color=ft.Colors.GREY_500,
+            text_align=ft.TextAlign.CENTER,
+        )
+        view = ft.Container(
             content=ft.Column([
-                ft.Icon(ft.Icons.INBOX, size=48 if self.is_mobile else 64, color=ft.Colors.GREY_600),
+                ft.Icon(icon, size=self._sizes["message_icon"], color=color),
                 ft.Text(
-                    "No Data Available",
-                    size=20 if self.is_mobile else 24,
+                    title,
+                    size=self._sizes["message_title"],
                     weight=ft.FontWeight.BOLD,
-                    color=ft.Colors.GREY_600,
-                ),
-                ft.Text(
-                    "Waiting for test results...",
-                    size=14 if self.is_mobile else 16,
-                    color=ft.Colors.GREY_500,
+                    color=color,
                 ),
+                message_text,
             ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-            padding=ft.padding.all(30 if self.is_mobile else 50),
+            padding=ft.padding.all(self._sizes["message_padding"]),
             alignment=ft.alignment.center,
             expand=True,
         )
-        
+        return view, message_text
+    
+    def _show_message(self, view: ft.Container, message):
+        """Replace the cards with a message view"""
         if self.is_mobile:
-            self.configs_container.controls.clear()
-            self.configs_container.controls.append(no_data_container)
-        else:
-            self.configs_grid.controls.clear()
-            self.configs_grid.controls.append(no_data_container)
+            self.cards_host.item_extent = None  # Let the message take its natural height
+        self.cards_host.controls = [view]
+        self.config_cards.clear()
+        self.card_parts.clear()
+        self.prev_data.clear()
+        self._name_lower.clear()
+        self._visible_names.clear()
+        self.showing_message = message
+        self._rendered_key = None
         
-        self.page.update()
+        self.schedule_update(self.cards_host)
+    
+    def show_no_data(self):
+        """Show no data message"""
+        if self.showing_message == "no_data":
+            return
+        
+        if self._no_data_view is None:
+            self._no_data_view, _ = self._build_message(
+                ft.Icons.INBOX, "No Data Available", "Waiting for test results...", ft.Colors.GREY_600
+            )
+        self._show_message(self._no_data_view, "no_data")
     
     def show_error(self, error_msg: str):
         """Show error message"""
-        error_container = ft.Container(
-            content=ft.Column([
-                ft.Icon(ft.Icons.ERROR_OUTLINE, size=48 if self.is_mobile else 64, color=ft.Colors.RED_400),
-                ft.Text(
-                    "Error Loading Data",
-                    size=20 if self.is_mobile else 24,
-                    weight=ft.FontWeight.BOLD,
-                    color=ft.Colors.RED_400,
-                ),
-                ft.Text(
-                    error_msg,
-                    size=14 if self.is_mobile else 16,
-                    color=ft.Colors.GREY_500,
-                    text_align=ft.TextAlign.CENTER,
-                ),
-            ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-            padding=ft.padding.all(30 if self.is_mobile else 50),
-            alignment=ft.alignment.center,
-            expand=True,
-        )
+        if self.showing_message == ("error", error_msg):
+            return
         
-        if self.is_mobile:
-            self.configs_container.controls.clear()
-            self.configs_container.controls.append(error_container)
-        else:
-            self.configs_grid.controls.clear()
-            self.configs_grid.controls.append(error_container)
-        
-        self.page.update()
+        if self._error_view is None:
+            self._error_view, self._error_text = self._build_message(
+                ft.Icons.ERROR_OUTLINE, "Error Loading Data", "", ft.Colors.RED_400
+            )
+        self._error_text.value = error_msg
+        self._show_message(self._error_view, ("error", error_msg))
+    
+    def results_changed(self) -> bool:
+        """Check whether the results file changed since it was last read"""
+        if self.shared_results is not None:
+            return self.shared_version is None or self.shared_version.value != self._results_cache_key
+        try:
+            st = self.results_file.stat()
+        except OSError:
+            return self._results_cache_key is not None
+        return (st.st_mtime_ns, st.st_size) != self._results_cache_key
     
     def start_auto_refresh(self):
-        """Start automatic refresh timer"""
-        def refresh_loop():
-            while True:
-                time.sleep(AUTO_REFRESH_INTERVAL)  # Use config value
-                try:
-                    self.load_results()
-                except Exception as e:
-                    print(f"Auto-refresh error: {e}")
-        
-        self.update_timer = threading.Thread(target=refresh_loop, daemon=True)
-        self.update_timer.start()
+        """Start automatic refresh, event-driven where the platform allows it"""
+        # Safe to call again on UI rebuilds; the process-wide watcher holds a set
+        _watcher.subscribe(self)
     
     def cleanup(self):
         """Cleanup resources"""
-        # Timer will be cleaned up automatically as it's a daemon thread
-        pass
+        _watcher.unsubscribe(self)
+        with self._render_lock:
+            self._closed = True
+            for timer in (self._render_timer, self._search_timer, self._resize_timer):
+                if timer is not None:
+                    timer.cancel()
+        
+        # Drop the widget trees so a closed session can be collected, once a
+        # render or filter already past its closed check has finished with them
+        with self._state_lock:
+            self.config_cards.clear()
+            self.card_parts.clear()
+            self.prev_data.clear()
+            self.cards_host = self.configs_container = self.configs_grid = None
+            self._no_data_view = self._error_view = self._error_text = None
 
 
-def run_web_server(host: str = None, port: int = None):
+def run_web_server(host: str = None, port: int = None, shared_results=None, shared_version=None):
     """Run the Flet web server with configurable host and port"""
     
     # Use config values if not provided
@@ -849,13 +1322,32 @@ def run_web_server(host: str = None, port: int = None):
     
     def main(page: ft.Page):
         # Create responsive dashboard
-        dashboard = MonitorDashboard(page)
+        dashboard = MonitorDashboard(page, shared_results, shared_version)
         
         # Handle cleanup on close
         def on_close(e):
             dashboard.cleanup()
         
         page.on_window_close = on_close
+        page.on_close = on_close  # Web sessions end here, not with a window
+    
+    # Log through this process's own queue listener; a setup inherited from the
+    # monitor process would hand records to a listener thread that only runs there.
+    # Console writes then happen on the listener thread, never on the event loop
+    log_queue = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
+    # Serve on uvloop where available; Flet starts its loop through asyncio.run
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     # Run as web app
     ft.app(